@@ -20,6 +20,12 @@ except ImportError:
     print("ERROR: must generate python templates first.")
     sys.exit(-1)
 
+# Message fragments emitted into every generated GTest header
+_FILE_MESSAGE = '    << "  File:     " << __FILE__ << "\\n" \\\n'
+_LINE_MESSAGE = '    << "  Line:     " << __LINE__ << "\\n"'
+_FAILURE_MESSAGE = '<< "\\n" \\\n' + _FILE_MESSAGE + _LINE_MESSAGE
+_LTLT = "<<"
+
 
 class GTestHVisitor(GTestVisitorBase.GTestVisitorBase):
     """
@@ -34,11 +40,7 @@ class GTestHVisitor(GTestVisitorBase.GTestVisitorBase):
         return self.emitNonPortParamsHpp(10, params)
 
     def emitMacroParams(self, params):
-        str = ""
-        for param in params:
-            name = param[0]
-            str += ", _" + name
-        return str
+        return "".join(", _" + param[0] for param in params)
 
     def initFilesVisit(self, obj):
         self.openFile("GTestBase.hpp")
@@ -48,8 +50,8 @@ class GTestHVisitor(GTestVisitorBase.GTestVisitorBase):
         self.initGTest(obj, c)
         c.emit_hpp_params = self.emitHppParams
         c.emit_macro_params = self.emitMacroParams
-        c.file_message = '    << "  File:     " << __FILE__ << "\\n" \\\n'
-        c.line_message = '    << "  Line:     " << __LINE__ << "\\n"'
-        c.failure_message = '<< "\\n" \\\n' + c.file_message + c.line_message
-        c.LTLT = "<<"
+        c.file_message = _FILE_MESSAGE
+        c.line_message = _LINE_MESSAGE
+        c.failure_message = _FAILURE_MESSAGE
+        c.LTLT = _LTLT
         self._writeTmpl(c, "startSourceFilesVisit")
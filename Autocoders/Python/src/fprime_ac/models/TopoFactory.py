@@ -17,7 +17,9 @@
 #
 
 import logging
+import os
 import sys
+from collections import deque
 
 from fprime_ac.models import Component, Port, Topology
 from fprime_ac.parsers import XmlComponentParser
@@ -25,6 +27,7 @@ from fprime_ac.utils import ConfigManager
 from fprime_ac.utils.buildroot import (
     BuildRootCollisionException,
     BuildRootMissingException,
+    get_build_roots,
     locate_build_root,
 )
 
@@ -36,6 +39,11 @@ from fprime_ac.utils.buildroot import (
 PRINT = logging.getLogger("output")
 DEBUG = logging.getLogger("debug")
 
+# Caches shared across create() calls so that component XML referenced by
+# several topologies in one run is only located and parsed once.
+_BUILD_ROOT_CACHE = {}  # (comp_xml_path, build roots) -> located file path
+_PARSED_COMPONENT_CACHE = {}  # (file_path, mtime) -> XmlComponentParser
+
 
 class TopoFactory:
     """
@@ -49,38 +57,45 @@ class TopoFactory:
 
     __instance = None
 
+    # Columns of the base id table: (header, padding, description)
+    _TABLE_INFO = (
+        ("INSTANCE NAME", 5, "Name of the instance object."),
+        ("BASE ID (HEX)", 0, "Base ID set for the instance."),
+        (
+            "REQUESTED WINDOW SIZE",
+            0,
+            "Specified by either the 'base_id_range' attribute in the instance tag or by finding the max of the 'base_id_range' attribute in the topology tag and the largest internal ID of the instance.",
+        ),
+        (
+            "DIFFERENCED ID WINDOW SIZE",
+            0,
+            "Calculated by subtracting the current base ID from the next base ID.",
+        ),
+        (
+            "LARGEST COMPONENT INTERNAL ID",
+            0,
+            "The largest ID found in the events, channels, and commands of the instance.",
+        ),
+        (
+            "MAX AMOUNT OF IDS",
+            0,
+            "The largest amount of items from either events, channels, or commands.",
+        ),
+    )
+
     def __init__(self):
         """
         Private Constructor (singleton pattern)
         """
-        self.__instance = None
         self.__config = ConfigManager.ConfigManager.getInstance()
         self.__generate_new_IDS = True  # Work around to disable ID generation/table output in the case AcConstants.ini is used to build
 
-        self.__table_info = [
-            ["INSTANCE NAME", 5, "Name of the instance object."],
-            ["BASE ID (HEX)", 0, "Base ID set for the instance."],
-            [
-                "REQUESTED WINDOW SIZE",
-                0,
-                "Specified by either the 'base_id_range' attribute in the instance tag or by finding the max of the 'base_id_range' attribute in the topology tag and the largest internal ID of the instance.",
-            ],
-            [
-                "DIFFERENCED ID WINDOW SIZE",
-                0,
-                "Calculated by subtracting the current base ID from the next base ID.",
-            ],
-            [
-                "LARGEST COMPONENT INTERNAL ID",
-                0,
-                "The largest ID found in the events, channels, and commands of the instance.",
-            ],
-            [
-                "MAX AMOUNT OF IDS",
-                0,
-                "The largest amount of items from either events, channels, or commands.",
-            ],
-        ]
+        # Column widths and format strings used when printing the base id table
+        self.__table_header_sizes = tuple(
+            len(header[0]) + 2 * header[1] for header in self._TABLE_INFO
+        )
+        self.__table_num_cols = len(self._TABLE_INFO)
+        self.__table_fmt = tuple("{0:^%d}" % size for size in self.__table_header_sizes)
 
     def set_generate_ID(self, value):
         """
@@ -89,6 +104,7 @@ class TopoFactory:
         """
         self.__generate_new_IDS = value
 
+    @staticmethod
     def getInstance():
         """
         Return instance of singleton.
@@ -98,9 +114,6 @@ class TopoFactory:
 
         return TopoFactory.__instance
 
-    # define static method
-    getInstance = staticmethod(getInstance)
-
     def create(self, the_parsed_topology_xml, generate_list_file=True):
         """
         Create a topology model here.
@@ -114,33 +127,34 @@ class TopoFactory:
         components = []
         for comp_xml_path in x.get_comp_type_file_header_dict():
             try:
-                file_path = locate_build_root(comp_xml_path)
+                file_path = self.__locate_component_xml(comp_xml_path)
             except (BuildRootMissingException, BuildRootCollisionException) as bre:
                 stri = "ERROR: Could not find XML file {}. {}".format(
                     comp_xml_path, str(bre)
                 )
                 raise OSError(stri)
-            processedXML = XmlComponentParser.XmlComponentParser(file_path)
+            processedXML = self.__parse_component_xml(file_path)
             comp_name = processedXML.get_component().get_name()
             componentXMLNameToComponent[comp_name] = processedXML
 
+        topology_xml_filename = x.get_xml_filename()
         for instance in x.get_instances():
-            if instance.get_type() not in list(componentXMLNameToComponent.keys()):
+            instance_type = instance.get_type()
+            comp_obj = componentXMLNameToComponent.get(instance_type)
+            if comp_obj is None:
                 PRINT.info(
                     "Component XML file type {} was not specified in the topology XML. Please specify the path using <import_component_type> tags.".format(
-                        instance.get_type()
+                        instance_type
                     )
                 )
             else:
-                instance.set_component_object(
-                    componentXMLNameToComponent[instance.get_type()]
-                )
+                instance.set_component_object(comp_obj)
             components.append(
                 Component.Component(
                     instance.get_namespace(),
                     instance.get_name(),
-                    instance.get_type(),
-                    xml_filename=x.get_xml_filename(),
+                    instance_type,
+                    xml_filename=topology_xml_filename,
                     kind2=instance.get_kind(),
                 )
             )
@@ -165,33 +179,37 @@ class TopoFactory:
         # Iterate over all the connection sources and assigned output ports to each Component..
         # For each output port you want to assign the connect comment, target component name, target port and type...
         #    (Requires adding to the model.Port class ether members or a member called of type TargetConnection)
+        # Index the connections by source component name so each component only visits its own connections
+        connections_by_source = {}
+        for connection in x.get_connections():
+            connections_by_source.setdefault(connection.get_source()[0], []).append(
+                connection
+            )
+
         for component in components:
             port_obj_list = []
-            for connection in x.get_connections():
-                if component.get_name() == connection.get_source()[0]:
-                    port = Port.Port(
-                        connection.get_source()[1],
-                        connection.get_source()[2],
-                        None,
-                        None,
-                        comment=connection.get_comment(),
-                        xml_filename=x.get_xml_filename,
-                    )
-                    port.set_source_num(connection.get_source()[3])
-                    port.set_target_comp(connection.get_target()[0])
-                    port.set_target_port(connection.get_target()[1])
-                    port.set_target_type(connection.get_target()[2])
-                    port.set_target_num(connection.get_target()[3])
-                    if connection.get_source()[1].startswith("i"):
-                        port.set_direction("input")
-                    else:
-                        port.set_direction("output")
-                    if connection.get_target()[1].startswith("i"):
-                        port.set_target_direction("input")
-                    else:
-                        port.set_target_direction("output")
-
-                    port_obj_list.append(port)
+            for connection in connections_by_source.get(component.get_name(), ()):
+                source = connection.get_source()
+                target = connection.get_target()
+                port = Port.Port(
+                    source[1],
+                    source[2],
+                    None,
+                    None,
+                    comment=connection.get_comment(),
+                    xml_filename=x.get_xml_filename,
+                )
+                port.set_source_num(source[3])
+                port.set_target_comp(target[0])
+                port.set_target_port(target[1])
+                port.set_target_type(target[2])
+                port.set_target_num(target[3])
+                port.set_direction("input" if source[1].startswith("i") else "output")
+                port.set_target_direction(
+                    "input" if target[1].startswith("i") else "output"
+                )
+
+                port_obj_list.append(port)
             component.set_ports(port_obj_list)
 
         # Instance a Topology class and give it namespace, comment and list of components.
@@ -207,10 +225,48 @@ class TopoFactory:
 
         return the_topology
 
+    def __locate_component_xml(self, comp_xml_path):
+        """
+        Locates a component XML file under the build roots, reusing
+        the result of any previous lookup for the same path while that
+        file still exists.
+        """
+        key = (comp_xml_path, frozenset(get_build_roots()))
+        file_path = _BUILD_ROOT_CACHE.get(key)
+        if file_path is not None and not os.path.exists(file_path):
+            del _BUILD_ROOT_CACHE[key]
+            file_path = None
+        if file_path is None:
+            file_path = locate_build_root(comp_xml_path)
+            _BUILD_ROOT_CACHE[key] = file_path
+        return file_path
+
+    def __parse_component_xml(self, file_path):
+        """
+        Parses a component XML file, reusing the parsed object from a
+        previous call if the file has not been modified since.
+        """
+        key = (file_path, os.path.getmtime(file_path))
+        processedXML = _PARSED_COMPONENT_CACHE.get(key)
+        if processedXML is None:
+            processedXML = XmlComponentParser.XmlComponentParser(file_path)
+            _PARSED_COMPONENT_CACHE[key] = processedXML
+        return processedXML
+
     def __id_to_int(self, id_string):
         """
         Converts ID to int. If the item is hex, it will be converted to an base 10 int.
         """
+        if isinstance(id_string, int):
+            return id_string
+        # Fast path for plain decimal and 0x-prefixed hex strings. The base is chosen
+        # explicitly so unprefixed strings such as "0b10" still fall through to hex below.
+        try:
+            if id_string[:2] in ("0x", "0X"):
+                return int(id_string, 16)
+            return int(id_string, 10)
+        except (TypeError, ValueError):
+            pass
         try:
             out = int(float(id_string))
         except (TypeError, ValueError):
@@ -224,9 +280,8 @@ class TopoFactory:
         """
         if not comp_xml:
             return None
-        highest_ID = None
 
-        event_id_list = []
+        event_id_list = set()
         for event in comp_xml.get_events():
             # if len(event.get_ids()) != 1:
             #   print("Component of type {} has multiple IDs for event {}. Please check if the ACConstants.ini file has all the ids set to zero.".format(comp_xml.get_component().get_name() , event.get_name()))
@@ -239,12 +294,9 @@ class TopoFactory:
                     )
                 )
                 sys.exit(-1)
-            event_id_list.append(id)
+            event_id_list.add(id)
 
-            if highest_ID is None or id > highest_ID:
-                highest_ID = id
-
-        channel_id_list = []
+        channel_id_list = set()
         for channel in comp_xml.get_channels():
             # if len(event.get_ids()) != 1:
             #   print("Component of type {} has multiple IDs for event {}. Please check if the ACConstants.ini file has all the ids set to zero.".format(comp_xml.get_component().get_name() , event.get_name()))
@@ -257,12 +309,9 @@ class TopoFactory:
                     )
                 )
                 sys.exit(-1)
-            channel_id_list.append(id)
-
-            if highest_ID is None or id > highest_ID:
-                highest_ID = id
+            channel_id_list.add(id)
 
-        command_id_list = []
+        command_id_list = set()
         for commands in comp_xml.get_commands():
             # if len(event.get_ids()) != 1:
             #   print("Component of type {} has multiple IDs for event {}. Please check if the ACConstants.ini file has all the ids set to zero.".format(comp_xml.get_component().get_name() , event.get_name()))
@@ -275,13 +324,10 @@ class TopoFactory:
                     )
                 )
                 sys.exit(-1)
-            command_id_list.append(id)
-
-            if highest_ID is None or id > highest_ID:
-                highest_ID = id
+            command_id_list.add(id)
 
-        parameter_id_list = []
-        parameter_opcode_list = []
+        parameter_id_list = set()
+        parameter_opcode_list = set()
         for parameters in comp_xml.get_parameters():
             # if len(event.get_ids()) != 1:
             #   print("Component of type {} has multiple IDs for event {}. Please check if the ACConstants.ini file has all the ids set to zero.".format(comp_xml.get_component().get_name() , event.get_name()))
@@ -295,10 +341,7 @@ class TopoFactory:
                     )
                 )
                 sys.exit(-1)
-            parameter_id_list.append(id)
-
-            if highest_ID is None or id > highest_ID:
-                highest_ID = id
+            parameter_id_list.add(id)
 
             # check set/save op and make sure they don't collide with command IDs
             # Set opcodes
@@ -319,10 +362,7 @@ class TopoFactory:
                     )
                 )
                 sys.exit(-1)
-            parameter_opcode_list.append(id)
-
-            if highest_ID is None or id > highest_ID:
-                highest_ID = id
+            parameter_opcode_list.add(id)
 
             # Save opcodes
 
@@ -342,11 +382,23 @@ class TopoFactory:
                     )
                 )
                 sys.exit(-1)
-            parameter_opcode_list.append(id)
-
-            if highest_ID is None or id > highest_ID:
-                highest_ID = id
-
+            parameter_opcode_list.add(id)
+
+        # Largest ID across all collections, computed once after the collision checks
+        highest_ID = max(
+            (
+                max(id_list)
+                for id_list in (
+                    event_id_list,
+                    channel_id_list,
+                    command_id_list,
+                    parameter_id_list,
+                    parameter_opcode_list,
+                )
+                if id_list
+            ),
+            default=None,
+        )
         if highest_ID is not None:
             return highest_ID + 1
 
@@ -441,24 +493,27 @@ class TopoFactory:
 
         # Pass 4 - Merge ID lists
 
+        with_ID_queue = deque(initial_comp_with_ID)
+        without_ID_queue = deque(initial_comp_without_ID)
+
         prev_id = id
         prev_window = 0
         with_ID_obj = None
         without_ID_obj = None
         while True:
             if (
-                len(initial_comp_with_ID) == 0
-                and len(initial_comp_without_ID) == 0
+                not with_ID_queue
+                and not without_ID_queue
                 and not with_ID_obj
                 and not without_ID_obj
             ):
                 break
 
-            if len(initial_comp_with_ID) > 0 and with_ID_obj is None:
-                with_ID_obj = initial_comp_with_ID.pop(0)
+            if with_ID_queue and with_ID_obj is None:
+                with_ID_obj = with_ID_queue.popleft()
 
-            if len(initial_comp_without_ID) > 0 and without_ID_obj is None:
-                without_ID_obj = initial_comp_without_ID.pop(0)
+            if without_ID_queue and without_ID_obj is None:
+                without_ID_obj = without_ID_queue.popleft()
 
             next_poss_id = (
                 prev_id + prev_window
@@ -488,7 +543,7 @@ class TopoFactory:
             prev_window = out_base_ids_list[-1][2]
 
         # Pass 5 - Save and Print table
-        save_buffer = ""
+        buf_parts = []
 
         prev = None
         act_wind = 0
@@ -496,11 +551,13 @@ class TopoFactory:
             if prev is not None:
                 # pylint: disable=E1136
                 act_wind = t[1] - prev[1]
-            save_buffer = self.__print_base_id_table(prev, act_wind, save_buffer)
+            self.__print_base_id_table(prev, act_wind, buf_parts)
             prev = t
-        save_buffer = self.__print_base_id_table(prev, "inf.", save_buffer)
+        self.__print_base_id_table(prev, "inf.", buf_parts)
 
-        save_buffer = self.__print_base_id_table_comments(save_buffer)
+        self.__print_base_id_table_comments(buf_parts)
+
+        save_buffer = "".join(buf_parts)
 
         if generate_list_file:
             csv_removed_from_path_name = xml_file_path.replace(".XML", "")
@@ -508,28 +565,34 @@ class TopoFactory:
 
             save_log_file_path = csv_removed_from_path_name + "_IDTableLog.txt"
 
-            save_log_file = open(save_log_file_path, "w")
-            save_log_file.write(save_buffer)
-            save_log_file.close()
+            # Encode once and emit the whole table with a single write
+            with open(save_log_file_path, "wb") as save_log_file:
+                save_log_file.write(save_buffer.encode("utf-8"))
 
         return out_base_ids_list
 
-    def __print_base_id_table_comments(self, save_buffer):
+    def __print_base_id_table_comments(self, buf_parts):
+        """
+        Routine prints the column descriptions of the base id table.
+        Each printed line is appended to buf_parts.
+        """
+        info_enabled = PRINT.isEnabledFor(logging.INFO)
         # First find the table length and the largest length of a column header
         tableSize = 0
         largestColHeader = 0
-        for header in self.__table_info:
+        for header in self._TABLE_INFO:
             headerLen = len(header[0])
             tableSize += headerLen + 2 * header[1]
             if headerLen > largestColHeader:
                 largestColHeader = headerLen
 
         print_item = "-" * (tableSize + 4)
-        PRINT.info(print_item)
-        save_buffer += print_item + "\n"
+        if info_enabled:
+            PRINT.info(print_item)
+        buf_parts.append(print_item + "\n")
 
         tabLen = largestColHeader + 3
-        for header in self.__table_info:
+        for header in self._TABLE_INFO:
             headerLen = len(header[0])
             desc = header[0] + " " * (largestColHeader - headerLen) + " - " + header[2]
             firstRun = True
@@ -545,28 +608,31 @@ class TopoFactory:
                 print_item = (
                     "| " + outString + ((tableSize - len(outString)) * " ") + " |"
                 )
-                PRINT.info(print_item)
-                save_buffer += print_item + "\n"
+                if info_enabled:
+                    PRINT.info(print_item)
+                buf_parts.append(print_item + "\n")
 
         print_item = "-" * (tableSize + 4)
-        PRINT.info(print_item)
-        save_buffer += print_item + "\n"
-
-        return save_buffer
+        if info_enabled:
+            PRINT.info(print_item)
+        buf_parts.append(print_item + "\n")
 
-    def __print_base_id_table(self, base_id_tuple, actual_window_size, save_buffer):
+    def __print_base_id_table(self, base_id_tuple, actual_window_size, buf_parts):
         """
         Routing prints the base_id_list to a table format.
-        If base_id_list is None, the routing prints the header
+        If base_id_list is None, the routing prints the header.
+        Each printed line is appended to buf_parts.
         """
+        info_enabled = PRINT.isEnabledFor(logging.INFO)
 
         if base_id_tuple is None:
             print_item = " | ".join(
                 header[1] * " " + header[0] + header[1] * " "
-                for header in self.__table_info
+                for header in self._TABLE_INFO
             )
-            save_buffer += print_item + "\n"
-            PRINT.info(print_item)
+            buf_parts.append(print_item + "\n")
+            if info_enabled:
+                PRINT.info(print_item)
 
         else:
             ns = ""
@@ -582,9 +648,7 @@ class TopoFactory:
             data_row.append(str(base_id_tuple[4]))
             data_row.append(str(base_id_tuple[5]))
 
-            table_header_size = [
-                len(header[0]) + 2 * header[1] for header in self.__table_info
-            ]
+            table_header_size = self.__table_header_sizes
 
             while True:
                 # Check if the items in the data_row  have a length of zero
@@ -595,18 +659,16 @@ class TopoFactory:
                 if all_items_length_zero:
                     break
 
-                row_string = ""
-                for i in range(len(self.__table_info)):
+                row_parts = []
+                for i in range(self.__table_num_cols):
                     curr_write_string = data_row[i][0 : table_header_size[i]]
                     data_row[i] = data_row[i][table_header_size[i] :]
-                    if i != 0:
-                        row_string += " | "
-                    format_string = "{0:^" + str(table_header_size[i]) + "}"
-                    row_string += format_string.format(curr_write_string)
-
-                save_buffer += row_string + "\n"
-                PRINT.info(row_string)
-        return save_buffer
+                    row_parts.append(self.__table_fmt[i].format(curr_write_string))
+
+                row_string = " | ".join(row_parts)
+                buf_parts.append(row_string + "\n")
+                if info_enabled:
+                    PRINT.info(row_string)
 
     def __set_base_id_list(self, id, size, inst):
         """
@@ -16,18 +16,19 @@
 #
 # Python standard modules
 #
+import concurrent.futures
 import hashlib
 import logging
 import os
+import pathlib
 import sys
 
-from fprime_ac.parsers import XmlParser
-from fprime_ac.utils import ConfigManager
+from fprime_ac.parsers import XmlParser, XmlSchemaCache
 from fprime_ac.utils.exceptions import (
     FprimeRngXmlValidationException,
     FprimeXmlException,
 )
-from lxml import etree, isoschematron
+from lxml import etree
 
 #
 # Python extension modules and custom interfaces
@@ -40,7 +41,8 @@ from lxml import etree, isoschematron
 # Global logger init. below.
 PRINT = logging.getLogger("output")
 DEBUG = logging.getLogger("debug")
-ROOTDIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..")
+
+
 #
 class XmlArrayParser(object):
     """
@@ -48,6 +50,25 @@ class XmlArrayParser(object):
     array type documents.  The class is instanced with an XML file name.
     """
 
+    _BASIC_TYPES = frozenset(
+        (
+            "U8",
+            "I8",
+            "BYTE",
+            "I16",
+            "U16",
+            "I32",
+            "U32",
+            "I64",
+            "U64",
+            "F32",
+            "F64",
+            "bool",
+            "ENUM",
+            "string",
+        )
+    )
+
     def __init__(self, xml_file=None):
         """
         Given a well formed XML file (xml_file), read it and turn it into
@@ -74,41 +95,19 @@ class XmlArrayParser(object):
         self.__default = []
         self.__xml_filename = xml_file
 
-        self.Config = ConfigManager.ConfigManager.getInstance()
-
-        typeslist = [
-            "U8",
-            "I8",
-            "BYTE",
-            "I16",
-            "U16",
-            "I32",
-            "U32",
-            "I64",
-            "U64",
-            "F32",
-            "F64",
-            "bool",
-            "ENUM",
-            "string",
-        ]
-
         if not os.path.isfile(xml_file):
             stri = "ERROR: Could not find specified XML file %s." % xml_file
             raise IOError(stri)
-        fd = open(xml_file, "r")
+        # Read the file once, the raw bytes are parsed here and hashed for the type id below
+        raw_xml = pathlib.Path(xml_file).read_bytes()
+        element_tree = etree.fromstring(
+            raw_xml, parser=XmlSchemaCache.INPUT_PARSER, base_url=xml_file
+        ).getroottree()
         xml_file = os.path.basename(xml_file)
         self.__xml_filename = xml_file
 
-        xml_parser = etree.XMLParser(remove_comments=True)
-        element_tree = etree.parse(fd, parser=xml_parser)
-        fd.close()  # Close the file, which is only used for the parsing above
-
         # Validate against current schema. if more are imported later in the process, they will be reevaluated
-        relax_file_handler = open(ROOTDIR + self.Config.get("schema", "array"), "r")
-        relax_parsed = etree.parse(relax_file_handler)
-        relax_file_handler.close()
-        relax_compiled = etree.RelaxNG(relax_parsed)
+        relax_compiled = XmlSchemaCache.get_validator("schema", "array")
 
         # 2/3 conversion
         if not relax_compiled.validate(element_tree):
@@ -118,53 +117,25 @@ class XmlArrayParser(object):
 
         array = element_tree.getroot()
         if array.tag != "array":
-            PRINT.info("%s is not an array definition file" % xml_file)
-            sys.exit(-1)
+            msg = "%s is not an array definition file" % xml_file
+            raise FprimeXmlException(msg)
 
-        print("Parsing Array %s" % array.attrib["name"])
+        DEBUG.debug("Parsing Array %s", array.attrib["name"])
         self.__name = array.attrib["name"]
 
-        if "namespace" in array.attrib:
-            self.__namespace = array.attrib["namespace"]
-
-        for array_tag in array:
-            if array_tag.tag == "format":
-                self.__format = array_tag.text
-            elif array_tag.tag == "type":
-                self.__type = array_tag.text
-                # Check if using external type
-                if not self.__type in typeslist:
-                    self.__typeinfo = "extern"
-                else:
-                    self.__typeinfo = "basic"
-
-                if "size" in array_tag.attrib:
-                    self.__string_size = array_tag.attrib["size"]
-            elif array_tag.tag == "typeid":
-                self.__type_id = array_tag.text
-            elif array_tag.tag == "size":
-                self.__size = array_tag.text
-            elif array_tag.tag == "default":
-                for value_tag in array_tag:
-                    self.__default.append(value_tag.text)
-            elif array_tag.tag == "comment":
-                self.__comment = array_tag.text
-            elif array_tag.tag == "include_header":
-                self.__include_header_files.append(array_tag.text)
-            elif array_tag.tag == "import_serializable_type":
-                self.__includes.append(array_tag.text)
-            elif array_tag.tag == "import_enum_type":
-                self.__include_enum_files.append(array_tag.text)
-            elif array_tag.tag == "import_array_type":
-                self.__include_array_files.append(array_tag.text)
+        self.__namespace = array.attrib.get("namespace")
+
+        # iterchildren only yields tags with a handler, so the dispatch needs no missing-key guard
+        for array_tag in array.iterchildren(*self._TAG_DISPATCH):
+            self._TAG_DISPATCH[array_tag.tag](self, array_tag)
 
         #
-        # Generate a type id here using SHA256 algorithm and XML stringified file.
+        # Generate a type id here using SHA256 algorithm and the raw XML file contents,
+        # unless one was already supplied by the typeid attribute of <type>.
         #
 
-        if not "typeid" in array.attrib:
-            s = etree.tostring(element_tree.getroot())
-            h = hashlib.sha256(s)
+        if self.__type_id is None:
+            h = hashlib.sha256(raw_xml)
             n = h.hexdigest()
             self.__type_id = "0x" + n.upper()[-8:]
 
@@ -174,12 +145,57 @@ class XmlArrayParser(object):
         curdir.replace(core, "")
         self.__include_path = curdir
 
+    def __parse_format(self, array_tag):
+        self.__format = array_tag.text
+
+    def __parse_type(self, array_tag):
+        self.__type = array_tag.text
+        # Check if using external type
+        if not self.__type in self._BASIC_TYPES:
+            self.__typeinfo = "extern"
+        else:
+            self.__typeinfo = "basic"
+
+        self.__string_size = array_tag.attrib.get("size")
+        self.__type_id = array_tag.attrib.get("typeid")
+
+    def __parse_size(self, array_tag):
+        self.__size = array_tag.text
+
+    def __parse_default(self, array_tag):
+        self.__default = [value_tag.text for value_tag in array_tag]
+
+    def __parse_comment(self, array_tag):
+        self.__comment = array_tag.text
+
+    def __parse_include_header(self, array_tag):
+        self.__include_header_files.append(array_tag.text)
+
+    def __parse_import_serializable_type(self, array_tag):
+        self.__includes.append(array_tag.text)
+
+    def __parse_import_enum_type(self, array_tag):
+        self.__include_enum_files.append(array_tag.text)
+
+    def __parse_import_array_type(self, array_tag):
+        self.__include_array_files.append(array_tag.text)
+
+    # Maps each child tag of <array> to the method that consumes it
+    _TAG_DISPATCH = {
+        "format": __parse_format,
+        "type": __parse_type,
+        "size": __parse_size,
+        "default": __parse_default,
+        "comment": __parse_comment,
+        "include_header": __parse_include_header,
+        "import_serializable_type": __parse_import_serializable_type,
+        "import_enum_type": __parse_import_enum_type,
+        "import_array_type": __parse_import_array_type,
+    }
+
     def validate_xml(self, dict_file, parsed_xml_tree, validator_type, validator_name):
         # Check that validator is valid
-        if (
-            not validator_type in self.Config
-            or not validator_name in self.Config[validator_type]
-        ):
+        if not XmlSchemaCache.has_validator(validator_type, validator_name):
             msg = (
                 "XML Validator type "
                 + validator_type
@@ -188,15 +204,9 @@ class XmlArrayParser(object):
             raise FprimeXmlException(msg)
 
         # Create proper xml validator tool
-        validator_file_handler = open(
-            ROOTDIR + self.Config.get(validator_type, validator_name), "r"
+        validator_compiled = XmlSchemaCache.get_validator(
+            validator_type, validator_name
         )
-        validator_parsed = etree.parse(validator_file_handler)
-        validator_file_handler.close()
-        if validator_type == "schema":
-            validator_compiled = etree.RelaxNG(validator_parsed)
-        elif validator_type == "schematron":
-            validator_compiled = isoschematron.Schematron(validator_parsed)
 
         # Validate XML file
         if not validator_compiled.validate(parsed_xml_tree):
@@ -204,14 +214,14 @@ class XmlArrayParser(object):
                 msg = "XML file {} is not valid according to {} {}.".format(
                     dict_file,
                     validator_type,
-                    ROOTDIR + self.Config.get(validator_type, validator_name),
+                    XmlSchemaCache.schema_path(validator_type, validator_name),
                 )
                 raise FprimeXmlException(msg)
             elif validator_type == "schematron":
                 msg = "WARNING: XML file {} is not valid according to {} {}.".format(
                     dict_file,
                     validator_type,
-                    ROOTDIR + self.Config.get(validator_type, validator_name),
+                    XmlSchemaCache.schema_path(validator_type, validator_name),
                 )
                 PRINT.info(msg)
 
@@ -261,6 +271,15 @@ class XmlArrayParser(object):
         return self.__include_array_files
 
 
+def parse_many(xml_files):
+    """
+    Parses many array XML files in parallel worker processes. Each worker keeps
+    its own schema and validator caches. Parsers are returned in input order.
+    """
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        return list(executor.map(XmlArrayParser, xml_files, chunksize=16))
+
+
 if __name__ == "__main__":
     xmlfile = sys.argv[1]
     xml = XmlParser.XmlParser(xmlfile)
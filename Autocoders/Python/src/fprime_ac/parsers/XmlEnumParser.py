@@ -20,13 +20,12 @@ import logging
 import os
 import sys
 
-from fprime_ac.parsers import XmlParser
-from fprime_ac.utils import ConfigManager
+from fprime_ac.parsers import XmlParser, XmlSchemaCache
 from fprime_ac.utils.exceptions import (
     FprimeRngXmlValidationException,
     FprimeXmlException,
 )
-from lxml import etree, isoschematron
+from lxml import etree
 
 #
 # Python extension modules and custom interfaces
@@ -39,7 +38,8 @@ from lxml import etree, isoschematron
 # Global logger init. below.
 PRINT = logging.getLogger("output")
 DEBUG = logging.getLogger("debug")
-ROOTDIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..")
+
+
 #
 class XmlEnumParser:
     """
@@ -61,71 +61,52 @@ class XmlEnumParser:
         self.__items = []
         self.__comment = None
 
-        self.Config = ConfigManager.ConfigManager.getInstance()
-
         if not os.path.isfile(xml_file):
             stri = "ERROR: Could not find specified XML file %s." % xml_file
             raise OSError(stri)
-        fd = open(xml_file)
+        # Let libxml2 read the file directly rather than through a Python file object
+        element_tree = etree.parse(xml_file, parser=XmlSchemaCache.INPUT_PARSER)
         xml_file = os.path.basename(xml_file)
         self.__xml_filename = xml_file
         self.__items = []
 
-        xml_parser = etree.XMLParser(remove_comments=True)
-        element_tree = etree.parse(fd, parser=xml_parser)
-        fd.close()  # Close the file, which is only used for the parsing above
-
         # Validate against current schema. if more are imported later in the process, they will be reevaluated
-        relax_file_handler = open(ROOTDIR + self.Config.get("schema", "enum"))
-        relax_parsed = etree.parse(relax_file_handler)
-        relax_file_handler.close()
-        relax_compiled = etree.RelaxNG(relax_parsed)
+        relax_compiled = XmlSchemaCache.get_validator("schema", "enum")
+
+        # Schematron only checks item values, run the structural RelaxNG check before it
+        if not relax_compiled.validate(element_tree):
+            raise FprimeRngXmlValidationException(relax_compiled.error_log)
 
         self.validate_xml(xml_file, element_tree, "schematron", "enum_value")
 
         self.check_enum_values(element_tree)
 
-        # 2/3 conversion
-        if not relax_compiled.validate(element_tree):
-            raise FprimeRngXmlValidationException(relax_compiled.error_log)
-
         enum = element_tree.getroot()
         if enum.tag != "enum":
-            PRINT.info("%s is not an enum definition file" % xml_file)
-            sys.exit(-1)
+            msg = "%s is not an enum definition file" % xml_file
+            raise FprimeXmlException(msg)
 
-        print("Parsing Enum %s" % enum.attrib["name"])
+        DEBUG.debug("Parsing Enum %s", enum.attrib["name"])
         self.__name = enum.attrib["name"]
 
-        if "namespace" in enum.attrib:
-            self.__namespace = enum.attrib["namespace"]
-        else:
-            self.__namespace = None
+        self.__namespace = enum.attrib.get("namespace")
 
-        if "default" in enum.attrib:
-            self.__default = enum.attrib["default"]
-        else:
-            self.__default = None
+        self.__default = enum.attrib.get("default")
 
-        if "serialize_type" in enum.attrib:
-            self.__serialize_type = enum.attrib["serialize_type"]
-        else:
-            self.__serialize_type = None
+        self.__serialize_type = enum.attrib.get("serialize_type")
 
-        for enum_tag in enum:
+        for enum_tag in enum.iterchildren("item", "comment"):
             if enum_tag.tag == "item":
                 item = enum_tag.attrib
-                if not "comment" in item:
-                    item["comment"] = ""
-                self.__items.append((item["name"], item["value"], item["comment"]))
-                if not "value" in item:
-                    item["value"] = ""
+                self.__items.append(
+                    (item["name"], item.get("value", ""), item.get("comment", ""))
+                )
             elif enum_tag.tag == "comment":
                 self.__comment = enum_tag.text
 
     def validate_xml(self, dict_file, parsed_xml_tree, validator_type, validator_name):
         # Check that validator is valid
-        if not self.Config.has_option(validator_type, validator_name):
+        if not XmlSchemaCache.has_validator(validator_type, validator_name):
             msg = (
                 "XML Validator type "
                 + validator_type
@@ -134,15 +115,9 @@ class XmlEnumParser:
             raise FprimeXmlException(msg)
 
         # Create proper xml validator tool
-        validator_file_handler = open(
-            ROOTDIR + self.Config.get(validator_type, validator_name)
+        validator_compiled = XmlSchemaCache.get_validator(
+            validator_type, validator_name
         )
-        validator_parsed = etree.parse(validator_file_handler)
-        validator_file_handler.close()
-        if validator_type == "schema":
-            validator_compiled = etree.RelaxNG(validator_parsed)
-        elif validator_type == "schematron":
-            validator_compiled = isoschematron.Schematron(validator_parsed)
 
         # Validate XML file
         if not validator_compiled.validate(parsed_xml_tree):
@@ -150,14 +125,14 @@ class XmlEnumParser:
                 msg = "XML file {} is not valid according to {} {}.".format(
                     dict_file,
                     validator_type,
-                    ROOTDIR + self.Config.get(validator_type, validator_name),
+                    XmlSchemaCache.schema_path(validator_type, validator_name),
                 )
                 raise FprimeXmlException(msg)
             elif validator_type == "schematron":
                 msg = "WARNING: XML file {} is not valid according to {} {}.".format(
                     dict_file,
                     validator_type,
-                    ROOTDIR + self.Config.get(validator_type, validator_name),
+                    XmlSchemaCache.schema_path(validator_type, validator_name),
                 )
                 PRINT.info(msg)
 
@@ -175,28 +150,18 @@ class XmlEnumParser:
         Returns true if either all or none of the enum items
         contain a given value
         """
-        has_value = 0
-        total = 0
-        for enum_item in element_tree.iter():
-            if enum_item.tag == "item":
-                total += 1
-                if val_name in enum_item.keys():
-                    has_value += 1
+        # Let libxml2 locate the items instead of filtering every node in Python
+        items = element_tree.findall(".//item")
+        has_value = sum(1 for enum_item in items if val_name in enum_item.attrib)
 
-        is_consistent = True
-        if not has_value in (0, total):
-            is_consistent = False
-
-        return is_consistent
+        return has_value in (0, len(items))
 
     def get_max_value(self):
         # Assumes that items have already been checked for consistency,
         # self.__items stores a list of tuples with index 1 being the value
         if not self.__items[0][1] == "":
-            max_value = self.__items[0][1]
-
-            for item in self.__items:
-                max_value = max(max_value, item[1])
+            # Compare numerically, string comparison would rank "9" above "10"
+            max_value = str(max(int(item[1]) for item in self.__items))
 
         else:
             max_value = str(len(self.__items) - 1)
@@ -31,6 +31,8 @@ from lxml import etree
 # Global logger init. below.
 PRINT = logging.getLogger("output")
 DEBUG = logging.getLogger("debug")
+
+
 #
 class XmlParser:
     def __init__(self, xml_file=None):
@@ -40,12 +42,10 @@ class XmlParser:
             stri = "ERROR: Could not find specified XML file {}.".format(xml_file)
             raise OSError(stri)
 
-        fd = open(xml_file)
-
-        element_tree = etree.parse(fd)
-        self.__root = element_tree.getroot().tag
-
-        fd.close()
+        # Only the root tag is needed, so stop at the first start event instead of building the whole tree
+        with open(xml_file, "rb") as fd:
+            _, root = next(etree.iterparse(fd, events=("start",)))
+        self.__root = root.tag
 
     def __call__(self):
         """"""
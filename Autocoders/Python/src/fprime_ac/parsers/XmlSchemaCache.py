@@ -0,0 +1,94 @@
+# ===============================================================================
+# NAME: XmlSchemaCache.py
+#
+# DESCRIPTION: Shared input parser and compiled RelaxNG/Schematron validators
+#              for the XML type parsers.
+#
+# USAGE:
+#
+# Copyright 2020, California Institute of Technology.
+# ALL RIGHTS RESERVED. U.S. Government Sponsorship acknowledged.
+# ===============================================================================
+#
+# Python standard modules
+#
+import functools
+import os
+import threading
+
+from fprime_ac.utils import ConfigManager
+from lxml import etree, isoschematron
+
+#
+# Universal globals used within module go here.
+# (DO NOT USE MANY!)
+#
+ROOTDIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..")
+
+_CONFIG = ConfigManager.ConfigManager.getInstance()
+
+# Schema file paths used by the array and enum parsers, resolved once at import
+_SCHEMA_PATHS = {
+    key: os.path.normpath(ROOTDIR + _CONFIG.get(*key))
+    for key in (
+        ("schema", "array"),
+        ("schematron", "array_default"),
+        ("schema", "enum"),
+        ("schematron", "enum_value"),
+    )
+}
+
+# Parser shared by all input files, lxml parsers are reusable across parses
+INPUT_PARSER = etree.XMLParser(remove_comments=True)
+
+# Compiled validators keyed on (validator type, validator name)
+_VALIDATOR_CACHE = {}
+_VALIDATOR_LOCK = threading.Lock()
+
+
+def schema_path(validator_type, validator_name):
+    """
+    Returns the normalized path of a schema file named in the ConfigManager.
+    """
+    path = _SCHEMA_PATHS.get((validator_type, validator_name))
+    if path is None:
+        path = os.path.normpath(ROOTDIR + _CONFIG.get(validator_type, validator_name))
+    return path
+
+
+def has_validator(validator_type, validator_name):
+    """
+    Returns True if the ConfigManager names a schema file for the validator.
+    """
+    return _CONFIG.has_option(validator_type, validator_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_schema_tree(path):
+    """
+    Parses a schema file, returning the same tree for repeated requests of the same path.
+    """
+    return etree.parse(path)
+
+
+def get_validator(validator_type, validator_name):
+    """
+    Returns the compiled RelaxNG or Schematron validator for the given
+    ConfigManager entry, compiling it on first use. Validation runs on the
+    parsed tree, lxml's XMLParser(schema=...) only accepts XML Schema.
+    """
+    key = (validator_type, validator_name)
+    validator_compiled = _VALIDATOR_CACHE.get(key)
+    if validator_compiled is None:
+        with _VALIDATOR_LOCK:
+            validator_compiled = _VALIDATOR_CACHE.get(key)
+            if validator_compiled is None:
+                validator_parsed = _load_schema_tree(
+                    schema_path(validator_type, validator_name)
+                )
+                if validator_type == "schema":
+                    validator_compiled = etree.RelaxNG(validator_parsed)
+                elif validator_type == "schematron":
+                    validator_compiled = isoschematron.Schematron(validator_parsed)
+                _VALIDATOR_CACHE[key] = validator_compiled
+    return validator_compiled
@@ -24,6 +24,13 @@ class FprimeRngXmlValidationException(FprimeException):
         last = last.replace("<string>:0:0:", "")
         super().__init__("Errors detected in XML:\n{}".format(last))
 
+    def __reduce__(self):
+        """
+        Pickle with the already formatted message. Unpickling must not run __init__ again, which would prefix the
+        message a second time when the exception is passed back from a worker process.
+        """
+        return FprimeException.__new__, (type(self),) + self.args, self.__dict__
+
 
 class FprimeXmlException(FprimeException):
     """Generic XML error"""
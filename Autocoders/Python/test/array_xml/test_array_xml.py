@@ -0,0 +1,86 @@
+"""
+test_array_xml.py:
+
+Checks the array XML parser's type id handling, and that parse_many parses array XML files in worker processes and
+passes errors back to the caller.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.environ["BUILD_ROOT"], "Autocoders", "Python", "src"))
+
+from fprime_ac.parsers import XmlArrayParser
+from fprime_ac.utils.exceptions import FprimeRngXmlValidationException
+
+TEST_DIR = os.path.join(os.environ["BUILD_ROOT"], "Autocoders", "Python", "test")
+ARRAY_XML_FILES = [
+    os.path.join(TEST_DIR, "array_xml", name)
+    for name in (
+        "StringArrayArrayAi.xml",
+        "ArrayTypeArrayAi.xml",
+        "InternalTypeArrayAi.xml",
+    )
+]
+
+
+def test_type_id_attribute(tmp_path):
+    """
+    Tests that a typeid attribute on <type> is used instead of the generated hash
+    """
+    xml_file = tmp_path / "TypeIdArrayAi.xml"
+    xml_file.write_text("""<?xml version="1.0" encoding="UTF-8"?>
+<array name="TypeId">
+    <type typeid="0x1234">U32</type>
+    <size>2</size>
+    <format>%u</format>
+    <default>
+        <value>1</value>
+        <value>2</value>
+    </default>
+</array>
+""")
+    array_xml = XmlArrayParser.XmlArrayParser(str(xml_file))
+    assert array_xml.get_type_id() == "0x1234"
+
+
+def test_type_id_generated():
+    """
+    Tests that arrays without a typeid attribute get an id hashed from the file contents
+    """
+    array_xml = XmlArrayParser.XmlArrayParser(ARRAY_XML_FILES[2])
+    assert array_xml.get_type_id().startswith("0x")
+    assert len(array_xml.get_type_id()) == 10
+
+
+def test_parse_many_order():
+    """
+    Tests that parse_many returns the same parsers as serial parsing, in input order
+    """
+    parsers = XmlArrayParser.parse_many(ARRAY_XML_FILES * 3)
+    expected = [
+        XmlArrayParser.XmlArrayParser(xml_file) for xml_file in ARRAY_XML_FILES * 3
+    ]
+    assert [parser.get_name() for parser in parsers] == [
+        parser.get_name() for parser in expected
+    ]
+    assert [parser.get_type_id() for parser in parsers] == [
+        parser.get_type_id() for parser in expected
+    ]
+    assert [parser.get_default() for parser in parsers] == [
+        parser.get_default() for parser in expected
+    ]
+
+
+def test_parse_many_error():
+    """
+    Tests that a validation error raised in a worker reaches the caller unchanged
+    """
+    enum_xml_file = os.path.join(TEST_DIR, "enum_xml", "Enum1EnumAi.xml")
+    with pytest.raises(FprimeRngXmlValidationException) as excinfo:
+        XmlArrayParser.parse_many(ARRAY_XML_FILES + [enum_xml_file])
+    message = str(excinfo.value)
+    assert message.startswith("Errors detected in XML:\n")
+    assert message.count("Errors detected in XML:") == 1
@@ -0,0 +1,61 @@
+"""
+test_enum_xml.py:
+
+Checks that the enum XML parser reports the numeric maximum of the item values. The numeric branch of get_max_value
+currently has no consumer: enum_cpp.tmpl only uses $max_value for enums without item values.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.environ["BUILD_ROOT"], "Autocoders", "Python", "src"))
+
+from fprime_ac.parsers import XmlEnumParser
+
+ENUM_XML_DIR = os.path.join(
+    os.environ["BUILD_ROOT"], "Autocoders", "Python", "test", "enum_xml"
+)
+
+
+def test_max_value_multi_digit():
+    """
+    Tests that multi-digit and negative values are compared numerically,
+    a string comparison would report "21" here
+    """
+    enum_xml = XmlEnumParser.XmlEnumParser(
+        os.path.join(ENUM_XML_DIR, "Enum1EnumAi.xml")
+    )
+    assert enum_xml.get_max_value() == "2000999333"
+
+
+def test_max_value_negative(tmp_path):
+    """
+    Tests the maximum of an enum whose values are all negative
+    """
+    xml_file = tmp_path / "NegativeEnumAi.xml"
+    xml_file.write_text("""<?xml version="1.0" encoding="UTF-8"?>
+<enum namespace="Example" name="Negative">
+    <item name="Item1" value="-100"/>
+    <item name="Item2" value="-3"/>
+    <item name="Item3" value="-25"/>
+</enum>
+""")
+    enum_xml = XmlEnumParser.XmlEnumParser(str(xml_file))
+    assert enum_xml.get_max_value() == "-3"
+
+
+def test_max_value_implicit(tmp_path):
+    """
+    Tests that enums without values report the index of the last item
+    """
+    xml_file = tmp_path / "ImplicitEnumAi.xml"
+    xml_file.write_text("""<?xml version="1.0" encoding="UTF-8"?>
+<enum namespace="Example" name="Implicit">
+    <item name="Item1"/>
+    <item name="Item2"/>
+    <item name="Item3"/>
+</enum>
+""")
+    enum_xml = XmlEnumParser.XmlEnumParser(str(xml_file))
+    assert [item[1] for item in enum_xml.get_items()] == ["", "", ""]
+    assert enum_xml.get_max_value() == "2"